@@ -56,3 +56,70 @@ LARGE = {
     8: " sextillion",
     9: " septillion",
 }
+
+# "thousand" has no plural form.
+LARGE_PLURAL = {
+    grade: suffix if grade == 2 else suffix + "s" for grade, suffix in LARGE.items()
+}
+
+
+def _three_digit_words(number: int) -> str:
+    """
+    Converts a number between 0 and 999 into words. Used only to build the lookup tables below.
+
+    Args:
+        number (int): The number to convert.
+
+    Returns:
+        str: The textual representation of the number, or an empty string for 0.
+    """
+    hundreds, rest = divmod(number, 100)
+
+    if rest < 10:
+        rest_words = SINGLES[rest]
+    else:
+        rest_words = (
+            UNIQUES.get(rest)
+            or DOUBLES.get(rest)
+            or f"{DOUBLES[rest - rest % 10]} {SINGLES[rest % 10]}"
+        )
+
+    if not hundreds:
+        return rest_words
+
+    if not rest_words:
+        return f"{SINGLES[hundreds]} {HUNDRED}"
+
+    return f"{SINGLES[hundreds]} {HUNDRED} and {rest_words}"
+
+
+# Words for every three digit group, indexed by the value of the group (0 - 999).
+THREE_DIGIT_WORDS = [_three_digit_words(number) for number in range(1000)]
+
+
+def _graded_three_digit_words(grade: int) -> list[str]:
+    """
+    Adds the suffix ('thousand', 'millions', etc.) of the given grade to the words of every three digit group.
+    Used only to build the lookup table below.
+
+    Args:
+        grade (int): The position of the group, counted from the right (2 for thousands).
+
+    Returns:
+        list[str]: The suffixed words, indexed by the value of the group (0 - 999).
+    """
+    return [
+        (
+            f"{words}{LARGE[grade] if number == 1 else LARGE_PLURAL[grade]}"
+            if number
+            else ""
+        )
+        for number, words in enumerate(THREE_DIGIT_WORDS)
+    ]
+
+
+# Words for every three digit group with the suffix of its grade, indexed by the grade
+# (1 for the last group, which has no suffix) and by the value of the group (0 - 999).
+GRADED_THREE_DIGIT_WORDS = {1: THREE_DIGIT_WORDS} | {
+    grade: _graded_three_digit_words(grade) for grade in LARGE
+}
@@ -1,5 +1,5 @@
 import unittest
-from src.number_to_text import NumberToText
+from src.number_to_text import NumberToText, numbers_to_text
 from data import constants
 
 
@@ -13,8 +13,11 @@ class NumberToTextShould(unittest.TestCase):
         invalid_numbers = [
             3.14,
             "3.14",
+            "--314",
+            "\u0663\u0661\u0664",
             constants.MAX_SUPPORTED_NUMBER + 1,
             str(constants.MAX_SUPPORTED_NUMBER + 1),
+            -(constants.MAX_SUPPORTED_NUMBER + 1),
         ]
 
         # Act & Assert
@@ -143,12 +146,13 @@ class NumberToTextShould(unittest.TestCase):
 
     def test_numberToText_handles_numbers_withLeadingZeros_andSpaces(self):
         # Arrange
-        test_input = ["000123", "  456  ", "   -456   ", "000123000"]
+        test_input = ["000123", "  456  ", "   -456   ", "000123000", "000001001"]
         expected_results = [
             "one hundred and twenty three",
             "four hundred and fifty six",
             "minus, four hundred and fifty six",
             "one hundred and twenty three thousand",
+            "one thousand and one",
         ]
 
         # Act & Assert
@@ -176,3 +180,24 @@ class NumberToTextShould(unittest.TestCase):
         # Act & Assert
         for i, input in enumerate(test_input):
             self.assertEqual(str(NumberToText(input)), expected_results[i])
+
+    def test_numbersToText_returns_sameResults_asNumberToText(self):
+        # Arrange
+        test_input = [0, "-0", 7, "000123", -1101001, 9876543210, "  456  "]
+        test_input += list(range(1000000, 10000000, 1000000))
+        test_input += [constants.MAX_SUPPORTED_NUMBER, -constants.MAX_SUPPORTED_NUMBER]
+        expected_results = [str(NumberToText(input)) for input in test_input]
+
+        # Act
+        actual_results = numbers_to_text(test_input)
+
+        # Assert
+        self.assertEqual(expected_results, actual_results)
+
+    def test_numbersToText_raises_ValueError_withInvalidInput(self):
+        # Arrange
+        test_input = [1, 2, 3.14]
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            _ = numbers_to_text(test_input)